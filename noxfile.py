@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import hashlib
 import os
 import pathlib
 import shutil
@@ -23,6 +24,14 @@ CURRENT_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
 SYSTEM_TEST_ENV_VARS = ("GOOGLE_APPLICATION_CREDENTIALS",)
 BLACK_VERSION = "black==22.3.0"
+FLAKE8_VERSION = "flake8==6.1.0"
+
+LINT_PATHS = (
+    os.path.join("google", "resumable_media"),
+    "tests",
+    os.path.join("google", "_async_resumable_media"),
+    "tests_async",
+)
 
 DEFAULT_PYTHON_VERSION = "3.8"
 SYSTEM_TEST_PYTHON_VERSIONS = ["3.8"]
@@ -31,6 +40,68 @@ UNIT_TEST_PYTHON_VERSIONS = ["3.7", "3.8", "3.9", "3.10", "3.11", "3.12", "3.13"
 # Error if a python version is missing
 nox.options.error_on_missing_interpreters = True
 
+# Use ``uv`` to create virtualenvs and install packages when it is available
+# (e.g. ``pip install nox[uv]``); its resolver is much faster than pip's.
+# Falls back to ``virtualenv`` + ``pip`` otherwise.
+nox.options.default_venv_backend = "uv|virtualenv"
+
+
+def _sources_hash(*paths):
+    """Hash the contents of the given files and the ``*.py`` files in dirs.
+
+    The noxfile itself is always included, so that changing a pinned tool
+    version (e.g. ``BLACK_VERSION`` or ``FLAKE8_VERSION``) invalidates any
+    stamp.
+    """
+    hash_obj = hashlib.blake2b(digest_size=16)
+    for path in sorted(("noxfile.py",) + paths):
+        full_path = CURRENT_DIRECTORY / path
+        if full_path.is_dir():
+            file_paths = sorted(full_path.rglob("*.py"))
+        else:
+            file_paths = [full_path]
+
+        for file_path in file_paths:
+            relative = file_path.relative_to(CURRENT_DIRECTORY).as_posix()
+            hash_obj.update(relative.encode("utf-8"))
+            hash_obj.update(file_path.read_bytes())
+
+    return hash_obj.hexdigest()
+
+
+def _stamp_path(name):
+    return CURRENT_DIRECTORY / ".nox" / "{}.stamp".format(name)
+
+
+def _sources_unchanged(session, name, sources_hash):
+    """Check if ``name`` last succeeded against the same sources.
+
+    Delete ``.nox/<name>.stamp`` to force a re-run.
+    """
+    stamp = _stamp_path(name)
+    if stamp.is_file() and stamp.read_text() == sources_hash:
+        session.log("Skipping {}: sources unchanged since last run.".format(name))
+        return True
+    return False
+
+
+def _write_stamp(name, sources_hash):
+    stamp = _stamp_path(name)
+    stamp.parent.mkdir(exist_ok=True)
+    stamp.write_text(sources_hash)
+
+
+def _maybe_clean_docs_build():
+    """Remove ``docs/_build`` only if ``DOCS_CLEAN`` is set.
+
+    Keeping the build directory lets Sphinx reuse its cached doctrees and
+    only re-render pages which changed. Sphinx only re-emits warnings for
+    the pages it re-reads, so ``-W`` in the ``docs`` session can miss
+    warnings on unchanged pages; set ``DOCS_CLEAN=1`` for a full check.
+    """
+    if os.environ.get("DOCS_CLEAN"):
+        shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
+
 
 @nox.session(python=UNIT_TEST_PYTHON_VERSIONS)
 def unit(session):
@@ -44,20 +115,29 @@ def unit(session):
     session.install("mock", "pytest", "pytest-cov", "pytest-asyncio<=0.14.0", "brotli")
     session.install("-e", ".[requests,aiohttp]", "-c", constraints_path)
 
+    # Coverage tracing slows the tests down noticeably; set ``COVERAGE=0``
+    # (e.g. ``COVERAGE=0 nox -s unit-3.8``) to skip it for quick local runs.
+    # The ``cover`` session needs the data collected here.
+    cov_args = []
+    if os.environ.get("COVERAGE", "1") == "1":
+        # NOTE: We don't require 100% line coverage for unit test runs since
+        #       some have branches that are Py2/Py3 specific.
+        line_coverage = "--cov-fail-under=0"
+        cov_args = [
+            "--cov=google.resumable_media",
+            "--cov=google._async_resumable_media",
+            "--cov=tests.unit",
+            "--cov=tests_async.unit",
+            "--cov-append",
+            "--cov-config=.coveragerc",
+            "--cov-report=",
+            line_coverage,
+        ]
+
     # Run py.test against the unit tests.
-    # NOTE: We don't require 100% line coverage for unit test runs since
-    #       some have branches that are Py2/Py3 specific.
-    line_coverage = "--cov-fail-under=0"
     session.run(
         "py.test",
-        "--cov=google.resumable_media",
-        "--cov=google._async_resumable_media",
-        "--cov=tests.unit",
-        "--cov=tests_async.unit",
-        "--cov-append",
-        "--cov-config=.coveragerc",
-        "--cov-report=",
-        line_coverage,
+        *cov_args,
         os.path.join("tests", "unit"),
         os.path.join("tests_async", "unit"),
         *session.posargs
@@ -84,7 +164,7 @@ def docs(session):
         "recommonmark",
     )
 
-    shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
+    _maybe_clean_docs_build()
     session.run(
         "sphinx-build",
         "-W",  # warnings as errors
@@ -118,6 +198,8 @@ def docfx(session):
         "recommonmark",
     )
 
+    # Always start from scratch: docfx_yaml only collects the objects of the
+    # documents Sphinx re-reads, so an incremental build writes partial YAML.
     shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
     session.run(
         "sphinx-build",
@@ -169,6 +251,27 @@ def doctest(session):
     )
 
 
+# Packages and commands shared by the individual static-check sessions and
+# ``static``, which runs all of them in one virtualenv.
+LINT_PACKAGES = (FLAKE8_VERSION, BLACK_VERSION)
+# ``uv`` venvs don't come with setuptools, which ``setup.py`` needs.
+SETUP_PY_CHECK_PACKAGES = ("setuptools", "docutils", "Pygments")
+MYPY_PACKAGES = ("mypy", "types-setuptools", "types-requests", "types-mock")
+
+
+def _run_lint(session):
+    session.run("flake8", *LINT_PATHS)
+    session.run("black", "--check", *LINT_PATHS)
+
+
+def _run_setup_py_check(session):
+    session.run("python", "setup.py", "check", "--restructuredtext", "--strict")
+
+
+def _run_mypy(session):
+    session.run("mypy", "-p", "google", "-p", "tests", "-p", "tests_async")
+
+
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def lint(session):
     """Run flake8.
@@ -176,55 +279,60 @@ def lint(session):
     Returns a failure if flake8 finds linting errors or sufficiently
     serious code quality issues.
     """
-    session.install("flake8", BLACK_VERSION)
+    sources_hash = _sources_hash(".flake8", *LINT_PATHS)
+    if _sources_unchanged(session, "lint", sources_hash):
+        return
+
+    session.install(*LINT_PACKAGES)
     session.install("-e", ".")
-    session.run(
-        "flake8",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
-    )
-    session.run(
-        "black",
-        "--check",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
-    )
+    _run_lint(session)
+    _write_stamp("lint", sources_hash)
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def lint_setup_py(session):
     """Verify that setup.py is valid (including RST check)."""
-    session.install("docutils", "Pygments")
-    session.run("python", "setup.py", "check", "--restructuredtext", "--strict")
+    sources_hash = _sources_hash("setup.py", "README.rst")
+    if _sources_unchanged(session, "lint_setup_py", sources_hash):
+        return
+
+    session.install(*SETUP_PY_CHECK_PACKAGES)
+    _run_setup_py_check(session)
+    _write_stamp("lint_setup_py", sources_hash)
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def blacken(session):
+    if _sources_unchanged(session, "blacken", _sources_hash(*LINT_PATHS)):
+        return
+
     session.install(BLACK_VERSION)
-    session.run(
-        "black",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
-    )
+    session.run("black", *LINT_PATHS)
+    # Stamp the formatted sources, so an immediate re-run is a no-op.
+    _write_stamp("blacken", _sources_hash(*LINT_PATHS))
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def mypy(session):
     """Verify type hints are mypy compatible."""
     session.install("-e", ".")
-    session.install(
-        "mypy",
-        "types-setuptools",
-        "types-requests",
-        "types-mock",
-    )
-    session.run("mypy", "-p", "google", "-p", "tests", "-p", "tests_async")
+    session.install(*MYPY_PACKAGES)
+    _run_mypy(session)
+
+
+@nox.session(python=DEFAULT_PYTHON_VERSION, reuse_venv=True, default=False)
+def static(session):
+    """Run all static checks in a single (reused) virtualenv.
+
+    Equivalent to running the ``lint``, ``lint_setup_py`` and ``mypy``
+    sessions, but only builds one virtualenv for all of them. It is left
+    out of a bare ``nox`` run, which already runs those three sessions.
+    """
+    session.install("-e", ".")
+    session.install(*LINT_PACKAGES, *SETUP_PY_CHECK_PACKAGES, *MYPY_PACKAGES)
+    _run_lint(session)
+    _run_setup_py_check(session)
+    _run_mypy(session)
 
 
 @nox.session(python=SYSTEM_TEST_PYTHON_VERSIONS)
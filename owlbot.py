@@ -1,26 +1,77 @@
+import filecmp
+import fnmatch
+import os
+import re
+
 import synthtool as s
 from synthtool import gcp
 
 common = gcp.CommonTemplates()
 
+
+def _changed_files(src, excludes=(), replacements=None):
+    """List the files under ``src`` which differ from the working tree.
+
+    ``src`` may be a single file or a directory; paths are returned
+    relative to the template root, i.e. as they appear in this repository.
+    ``replacements`` maps such a path to the ``(pattern, repl)`` which this
+    script later applies to it with ``s.replace``, so that the template is
+    compared as it will end up.
+    """
+    replacements = replacements or {}
+    root = src.parent
+    if src.is_dir():
+        candidates = (path for path in src.rglob("*") if path.is_file())
+    else:
+        candidates = (src,)
+
+    changed = []
+    for path in candidates:
+        if any(fnmatch.fnmatch(path.name, pattern) for pattern in excludes):
+            continue
+        relative = path.relative_to(root).as_posix()
+        if not os.path.isfile(relative):
+            changed.append(relative)
+        elif relative in replacements:
+            pattern, repl = replacements[relative]
+            expected = re.sub(pattern, repl, path.read_text())
+            with open(relative) as file_obj:
+                if file_obj.read() != expected:
+                    changed.append(relative)
+        elif not filecmp.cmp(path, relative, shallow=False):
+            changed.append(relative)
+
+    return changed
+
+
+def _move_if_changed(src, excludes=(), replacements=None):
+    """Move ``src`` into the repository only if it would change anything."""
+    if _changed_files(src, excludes, replacements):
+        s.move(src, excludes=list(excludes))
+
+
+# Applied with ``s.replace`` after the templates are moved (see below).
+DOCS_CONFIG = ".kokoro/docs/common.cfg"
+DOCS_STAGING_BUCKET = (r'value: "docs-staging-v2"', r'value: "docs-staging-v2-dev"')
+
 # ----------------------------------------------------------------------------
 # Add templated .kokoro files
 # ----------------------------------------------------------------------------
 templated_files = common.py_library()
-s.move(templated_files / ".kokoro")
-s.move(templated_files / ".trampolinerc")
-s.move(templated_files / ".github")
-s.move(templated_files / "renovate.json")
-s.move(templated_files / "docs", excludes=[
-  "multiprocessing.rst", 
+_move_if_changed(
+    templated_files / ".kokoro", replacements={DOCS_CONFIG: DOCS_STAGING_BUCKET}
+)
+_move_if_changed(templated_files / ".trampolinerc")
+_move_if_changed(templated_files / ".github")
+_move_if_changed(templated_files / "renovate.json")
+_move_if_changed(templated_files / "docs", excludes=[
+  "multiprocessing.rst",
   "conf.py"
 ])
 
 # Block pushing non-cloud libraries to Cloud RAD
-s.replace(
-    ".kokoro/docs/common.cfg",
-    r'value: "docs-staging-v2"',
-    r'value: "docs-staging-v2-dev"'
-)
+s.replace(DOCS_CONFIG, *DOCS_STAGING_BUCKET)
 
+# NOTE: ``blacken`` is a no-op (without installing black) when the sources
+#       are unchanged since its last run; see ``noxfile.py``.
 s.shell.run(["nox", "-s", "blacken"], hide_output=False)
@@ -16,6 +16,7 @@
 import google.auth  # type: ignore
 import google.auth.transport.requests as tr_requests  # type: ignore
 import pytest  # type: ignore
+import requests.adapters
 
 from tests.system import utils
 
@@ -46,7 +47,16 @@ def cleanup_bucket(transport):
 @pytest.fixture(scope="session")
 def authorized_transport():
     credentials, _ = google.auth.default(scopes=(utils.GCS_RW_SCOPE,))
-    yield tr_requests.AuthorizedSession(credentials)
+    # Fetch the access token up front, so that fixtures sharing these
+    # credentials don't each trigger a refresh on their first request.
+    credentials.refresh(tr_requests.Request())
+    session = tr_requests.AuthorizedSession(credentials)
+    # Keep enough connections per host alive for the tests which issue
+    # requests concurrently, so that they are reused across tests rather
+    # than each paying for a new TCP + TLS handshake.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    yield session
 
 
 @pytest.fixture(scope="session")
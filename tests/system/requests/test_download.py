@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import base64
+import concurrent.futures
 import copy
+import functools
 import hashlib
 import http.client
 import io
 import os
+import threading
+from unittest import mock
 
-import google.auth  # type: ignore
 import google.auth.transport.requests as tr_requests  # type: ignore
 import pytest  # type: ignore
 
@@ -133,21 +136,25 @@ ALL_FILES = (
 )
 
 
-def get_contents_for_upload(info):
-    with open(info["path"], "rb") as file_obj:
+@functools.lru_cache(maxsize=None)
+def _read_file(path):
+    # The data files never change, so read each of them at most once.
+    with open(path, "rb") as file_obj:
         return file_obj.read()
 
 
+def get_contents_for_upload(info):
+    return _read_file(info["path"])
+
+
 def get_contents(info):
     full_path = info.get("uncompressed", info["path"])
-    with open(full_path, "rb") as file_obj:
-        return file_obj.read()
+    return _read_file(full_path)
 
 
 def get_raw_contents(info):
     full_path = info["path"]
-    with open(full_path, "rb") as file_obj:
-        return file_obj.read()
+    return _read_file(full_path)
 
 
 def get_blob_name(info):
@@ -155,8 +162,25 @@ def get_blob_name(info):
     return os.path.basename(full_path)
 
 
+# Blob name and media URL for each of ``ALL_FILES``, computed just once.
+ALL_BLOBS = tuple(
+    (info, get_blob_name(info), utils.get_media_url(get_blob_name(info)))
+    for info in ALL_FILES
+)
+# Only the (large) files which have ``slices`` to download.
+SLICED_BLOBS = tuple(blob for blob in ALL_BLOBS if blob[0]["slices"])
+
+# Run a test once per blob, e.g. as ``test_download_to_stream[image1.jpg]``.
+parametrize_blobs = pytest.mark.parametrize(
+    "info,blob_name,media_url", ALL_BLOBS, ids=[blob[1] for blob in ALL_BLOBS]
+)
+parametrize_sliced_blobs = pytest.mark.parametrize(
+    "info,blob_name,media_url", SLICED_BLOBS, ids=[blob[1] for blob in SLICED_BLOBS]
+)
+
+
 def delete_blob(transport, blob_name):
-    metadata_url = utils.METADATA_URL_TEMPLATE.format(blob_name=blob_name)
+    metadata_url = utils.get_metadata_url(blob_name)
     response = transport.delete(metadata_url)
     assert response.status_code == http.client.NO_CONTENT
 
@@ -166,7 +190,7 @@ def secret_file(authorized_transport, bucket):
     blob_name = "super-seekrit.txt"
     data = b"Please do not tell anyone my encrypted seekrit."
 
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     headers = utils.get_encryption_headers()
     upload = resumable_requests.SimpleUpload(upload_url, headers=headers)
     response = upload.transmit(authorized_transport, data, PLAIN_TEXT)
@@ -179,15 +203,15 @@ def secret_file(authorized_transport, bucket):
 
 # Transport that returns corrupt data, so we can exercise checksum handling.
 @pytest.fixture(scope="module")
-def corrupting_transport():
-    credentials, _ = google.auth.default(scopes=(utils.GCS_RW_SCOPE,))
-    yield CorruptingAuthorizedSession(credentials)
+def corrupting_transport(authorized_transport):
+    # Share the (already refreshed) credentials of ``authorized_transport``.
+    yield CorruptingAuthorizedSession(authorized_transport.credentials)
 
 
 @pytest.fixture(scope="module")
 def simple_file(authorized_transport, bucket):
     blob_name = "basic-file.txt"
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     upload = resumable_requests.SimpleUpload(upload_url)
     data = b"Simple contents"
     response = upload.transmit(authorized_transport, data, PLAIN_TEXT)
@@ -198,39 +222,45 @@ def simple_file(authorized_transport, bucket):
     delete_blob(authorized_transport, blob_name)
 
 
+def upload_file(transport, info):
+    to_upload = get_contents_for_upload(info)
+    blob_name = get_blob_name(info)
+
+    if "metadata" in info:
+        upload = resumable_requests.MultipartUpload(utils.MULTIPART_UPLOAD)
+        metadata = copy.deepcopy(info["metadata"])
+        metadata["name"] = blob_name
+        response = upload.transmit(transport, to_upload, metadata, info["content_type"])
+    else:
+        upload_url = utils.get_simple_upload_url(blob_name)
+        upload = resumable_requests.SimpleUpload(upload_url)
+        response = upload.transmit(transport, to_upload, info["content_type"])
+
+    assert response.status_code == http.client.OK
+    return blob_name
+
+
 @pytest.fixture(scope="module")
 def add_files(authorized_transport, bucket):
-    blob_names = []
-    for info in ALL_FILES:
-        to_upload = get_contents_for_upload(info)
-        blob_name = get_blob_name(info)
-
-        blob_names.append(blob_name)
-        if "metadata" in info:
-            upload = resumable_requests.MultipartUpload(utils.MULTIPART_UPLOAD)
-            metadata = copy.deepcopy(info["metadata"])
-            metadata["name"] = blob_name
-            response = upload.transmit(
-                authorized_transport, to_upload, metadata, info["content_type"]
-            )
-        else:
-            upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
-            upload = resumable_requests.SimpleUpload(upload_url)
-            response = upload.transmit(
-                authorized_transport, to_upload, info["content_type"]
+    # The uploads are independent, so overlap them.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        blob_names = list(
+            executor.map(
+                functools.partial(upload_file, authorized_transport), ALL_FILES
             )
-
-        assert response.status_code == http.client.OK
+        )
 
     yield
 
     # Clean-up the blobs we created.
-    for blob_name in blob_names:
-        delete_blob(authorized_transport, blob_name)
+    status_codes = utils.delete_blobs(authorized_transport, blob_names)
+    assert status_codes == [http.client.NO_CONTENT] * len(blob_names)
 
 
-def check_tombstoned(download, transport):
+def check_tombstoned(download):
     assert download.finished
+    # A finished download must refuse to run before touching the transport.
+    transport = mock.Mock(spec=["request"])
     if isinstance(download, SIMPLE_DOWNLOADS):
         with pytest.raises(ValueError) as exc_info:
             download.consume(transport)
@@ -239,6 +269,7 @@ def check_tombstoned(download, transport):
         with pytest.raises(ValueError) as exc_info:
             download.consume_next_chunk(transport)
         assert exc_info.match("Download has finished.")
+    transport.request.assert_not_called()
 
 
 def check_error_response(exc_info, status_code, message):
@@ -268,40 +299,40 @@ class TestDownload(object):
     def _read_response_content(response):
         return response.content
 
+    @parametrize_blobs
     @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
-    def test_download_full(self, add_files, authorized_transport, checksum):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
-
-            # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            download = self._make_one(media_url, checksum=checksum)
-            # Consume the resource.
-            response = download.consume(authorized_transport)
-            assert response.status_code == http.client.OK
-            assert self._read_response_content(response) == actual_contents
-            check_tombstoned(download, authorized_transport)
-
-    def test_download_to_stream(self, add_files, authorized_transport):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
-
-            # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            stream = io.BytesIO()
-            download = self._make_one(media_url, stream=stream)
-            # Consume the resource.
-            response = download.consume(authorized_transport)
-            assert response.status_code == http.client.OK
-            with pytest.raises(RuntimeError) as exc_info:
-                getattr(response, "content")
-            assert exc_info.value.args == (NO_BODY_ERR,)
-            assert response._content is False
-            assert response._content_consumed is True
-            assert stream.getvalue() == actual_contents
-            check_tombstoned(download, authorized_transport)
+    def test_download_full(
+        self, add_files, authorized_transport, checksum, info, blob_name, media_url
+    ):
+        actual_contents = self._get_contents(info)
+
+        # Create the actual download object.
+        download = self._make_one(media_url, checksum=checksum)
+        # Consume the resource.
+        response = download.consume(authorized_transport)
+        assert response.status_code == http.client.OK
+        assert self._read_response_content(response) == actual_contents
+        check_tombstoned(download)
+
+    @parametrize_blobs
+    def test_download_to_stream(
+        self, add_files, authorized_transport, info, blob_name, media_url
+    ):
+        actual_contents = self._get_contents(info)
+
+        # Create the actual download object.
+        stream = io.BytesIO()
+        download = self._make_one(media_url, stream=stream)
+        # Consume the resource.
+        response = download.consume(authorized_transport)
+        assert response.status_code == http.client.OK
+        with pytest.raises(RuntimeError) as exc_info:
+            getattr(response, "content")
+        assert exc_info.value.args == (NO_BODY_ERR,)
+        assert response._content is False
+        assert response._content_consumed is True
+        assert stream.getvalue() == actual_contents
+        check_tombstoned(download)
 
     def test_download_gzip_w_stored_content_headers(
         self, add_files, authorized_transport
@@ -312,7 +343,7 @@ class TestDownload(object):
         blob_name = get_blob_name(info)
 
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         stream = io.BytesIO()
         download = self._make_one(media_url, stream=stream)
         # Consume the resource.
@@ -321,7 +352,7 @@ class TestDownload(object):
         assert response.headers.get(_helpers._STORED_CONTENT_ENCODING_HEADER) == "gzip"
         assert response.headers.get("X-Goog-Stored-Content-Length") is not None
         assert stream.getvalue() == actual_contents
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
 
     @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
     def test_download_brotli_w_stored_content_headers(
@@ -333,7 +364,7 @@ class TestDownload(object):
         blob_name = get_blob_name(info)
 
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         stream = io.BytesIO()
         download = self._make_one(media_url, stream=stream, checksum=checksum)
         # Consume the resource.
@@ -342,36 +373,36 @@ class TestDownload(object):
         assert response.headers.get(_helpers._STORED_CONTENT_ENCODING_HEADER) == "br"
         assert response.headers.get("X-Goog-Stored-Content-Length") is not None
         assert stream.getvalue() == actual_contents
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
 
     def test_extra_headers(self, authorized_transport, secret_file):
         blob_name, data, headers = secret_file
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url, headers=headers)
         # Consume the resource.
         response = download.consume(authorized_transport)
         assert response.status_code == http.client.OK
         assert response.content == data
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
         # Attempt to consume the resource **without** the headers.
         download_wo = self._make_one(media_url)
         with pytest.raises(common.InvalidResponse) as exc_info:
             download_wo.consume(authorized_transport)
 
         check_error_response(exc_info, http.client.BAD_REQUEST, ENCRYPTED_ERR)
-        check_tombstoned(download_wo, authorized_transport)
+        check_tombstoned(download_wo)
 
     def test_non_existent_file(self, authorized_transport, bucket):
         blob_name = "does-not-exist.txt"
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url)
 
         # Try to consume the resource and fail.
         with pytest.raises(common.InvalidResponse) as exc_info:
             download.consume(authorized_transport)
         check_error_response(exc_info, http.client.NOT_FOUND, NOT_FOUND_ERR)
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
 
     def test_bad_range(self, simple_file, authorized_transport):
         blob_name, data = simple_file
@@ -380,7 +411,7 @@ class TestDownload(object):
         end = 63
         assert len(data) < start < end
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url, start=start, end=end)
 
         # Try to consume the resource and fail.
@@ -392,7 +423,7 @@ class TestDownload(object):
             http.client.REQUESTED_RANGE_NOT_SATISFIABLE,
             b"Request range not satisfiable",
         )
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
 
     def _download_slice(self, media_url, slice_):
         assert slice_.step is None
@@ -403,19 +434,50 @@ class TestDownload(object):
 
         return self._make_one(media_url, start=slice_.start, end=end)
 
-    def test_download_partial(self, add_files, authorized_transport):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
+    @parametrize_sliced_blobs
+    def test_download_partial(
+        self, add_files, authorized_transport, info, blob_name, media_url
+    ):
+        # Slicing a memoryview compares each range without copying it.
+        actual_contents = memoryview(self._get_contents(info))
+
+        slices = info["slices"]
+        downloads = [self._download_slice(media_url, slice_) for slice_ in slices]
+        # The slices are independent, so download them concurrently.
+        with concurrent.futures.ThreadPoolExecutor(len(downloads)) as executor:
+            responses = list(
+                executor.map(
+                    lambda download: download.consume(authorized_transport), downloads
+                )
+            )
 
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            for slice_ in info["slices"]:
-                download = self._download_slice(media_url, slice_)
-                response = download.consume(authorized_transport)
-                assert response.status_code == http.client.PARTIAL_CONTENT
-                assert response.content == actual_contents[slice_]
-                with pytest.raises(ValueError):
-                    download.consume(authorized_transport)
+        for slice_, download, response in zip(slices, downloads, responses):
+            assert response.status_code == http.client.PARTIAL_CONTENT
+            assert response.content == actual_contents[slice_]
+            check_tombstoned(download)
+
+    @parametrize_sliced_blobs
+    def test_download_ranges_concurrently(
+        self, add_files, authorized_transport, info, blob_name, media_url
+    ):
+        actual_contents = self._get_contents(info)
+
+        total_bytes = len(actual_contents)
+        num_chunks, chunk_size = get_chunk_size(7, total_bytes)
+        stream = io.BytesIO()
+        responses = download_ranges_concurrently(
+            self._make_one,
+            media_url,
+            authorized_transport,
+            total_bytes,
+            chunk_size,
+            stream,
+        )
+        assert len(responses) == num_chunks
+        for response in responses:
+            assert response.status_code == http.client.PARTIAL_CONTENT
+        # Make sure the ranges were reassembled in order.
+        assert stream.getvalue() == actual_contents
 
 
 class TestRawDownload(TestDownload):
@@ -435,45 +497,43 @@ class TestRawDownload(TestDownload):
             )
         )
 
+    @parametrize_blobs
     @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
-    def test_corrupt_download(self, add_files, corrupting_transport, checksum):
-        for info in ALL_FILES:
-            blob_name = get_blob_name(info)
-
-            # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            stream = io.BytesIO()
-            download = self._make_one(media_url, stream=stream, checksum=checksum)
-            # Consume the resource.
-            with pytest.raises(common.DataCorruption) as exc_info:
-                download.consume(corrupting_transport)
-
-            assert download.finished
-
-            if checksum == "md5":
-                EMPTY_HASH = CorruptingAuthorizedSession.EMPTY_MD5
-            else:
-                EMPTY_HASH = CorruptingAuthorizedSession.EMPTY_CRC32C
-            msg = download_mod._CHECKSUM_MISMATCH.format(
-                download.media_url,
-                EMPTY_HASH,
-                info[checksum],
-                checksum_type=checksum.upper(),
-            )
-            assert msg in exc_info.value.args[0]
+    def test_corrupt_download(
+        self, add_files, corrupting_transport, checksum, info, blob_name, media_url
+    ):
+        # Create the actual download object.
+        stream = io.BytesIO()
+        download = self._make_one(media_url, stream=stream, checksum=checksum)
+        # Consume the resource.
+        with pytest.raises(common.DataCorruption) as exc_info:
+            download.consume(corrupting_transport)
 
-    def test_corrupt_download_no_check(self, add_files, corrupting_transport):
-        for info in ALL_FILES:
-            blob_name = get_blob_name(info)
+        assert download.finished
 
-            # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            stream = io.BytesIO()
-            download = self._make_one(media_url, stream=stream, checksum=None)
-            # Consume the resource.
-            download.consume(corrupting_transport)
+        if checksum == "md5":
+            EMPTY_HASH = CorruptingAuthorizedSession.EMPTY_MD5
+        else:
+            EMPTY_HASH = CorruptingAuthorizedSession.EMPTY_CRC32C
+        msg = download_mod._CHECKSUM_MISMATCH.format(
+            download.media_url,
+            EMPTY_HASH,
+            info[checksum],
+            checksum_type=checksum.upper(),
+        )
+        assert msg in exc_info.value.args[0]
 
-            assert download.finished
+    @parametrize_blobs
+    def test_corrupt_download_no_check(
+        self, add_files, corrupting_transport, info, blob_name, media_url
+    ):
+        # Create the actual download object.
+        stream = io.BytesIO()
+        download = self._make_one(media_url, stream=stream, checksum=None)
+        # Consume the resource.
+        download.consume(corrupting_transport)
+
+        assert download.finished
 
 
 def get_chunk_size(min_chunks, total_bytes):
@@ -490,12 +550,45 @@ def get_chunk_size(min_chunks, total_bytes):
     return num_chunks, chunk_size
 
 
+def download_ranges_concurrently(
+    make_download, media_url, transport, total_bytes, chunk_size, stream, concurrency=6
+):
+    """Download a resource as independent byte ranges, in parallel.
+
+    Each range is fetched by its own download (created via ``make_download``)
+    and written to ``stream`` at its own offset, so the responses may
+    complete in any order.
+
+    Returns:
+        List[~requests.Response]: The responses, in byte range order.
+    """
+    lock = threading.Lock()
+
+    def download_range(start):
+        end = min(start + chunk_size, total_bytes) - 1
+        download = make_download(media_url, start=start, end=end)
+        response = download.consume(transport)
+        with lock:
+            stream.seek(start)
+            stream.write(response.content)
+        return response
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(download_range, range(0, total_bytes, chunk_size)))
+
+
 def consume_chunks(download, authorized_transport, total_bytes, actual_contents):
     start_byte = download.start
     end_byte = download.end
     if end_byte is None:
         end_byte = total_bytes - 1
 
+    # Rather than slicing (i.e. copying) the expected bytes for every chunk,
+    # check each chunk's size and compare a running CRC32C at the end.
+    expected_checksum = _helpers._get_crc32c_object()
+    expected_checksum.update(actual_contents[start_byte : end_byte + 1])
+    actual_checksum = _helpers._get_crc32c_object()
+
     num_responses = 0
     while not download.finished:
         response = download.consume_next_chunk(authorized_transport)
@@ -505,9 +598,11 @@ def consume_chunks(download, authorized_transport, total_bytes, actual_contents)
         assert download.bytes_downloaded == next_byte - download.start
         assert download.total_bytes == total_bytes
         assert response.status_code == http.client.PARTIAL_CONTENT
-        assert response.content == actual_contents[start_byte:next_byte]
+        assert len(response.content) == next_byte - start_byte
+        actual_checksum.update(response.content)
         start_byte = next_byte
 
+    assert actual_checksum.digest() == expected_checksum.digest()
     return num_responses, response
 
 
@@ -523,49 +618,58 @@ class TestChunkedDownload(object):
     def _get_contents(info):
         return get_contents(info)
 
-    def test_chunked_download_partial(self, add_files, authorized_transport):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
-
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            for slice_ in info["slices"]:
-                # Manually replace a missing start with 0.
-                start = 0 if slice_.start is None else slice_.start
-                # Chunked downloads don't support a negative index.
-                if start < 0:
-                    continue
-
-                # First determine how much content is in the slice and
-                # use it to determine a chunking strategy.
-                total_bytes = len(actual_contents)
-                if slice_.stop is None:
-                    end_byte = total_bytes - 1
-                    end = None
-                else:
-                    # Python slices DO NOT include the last index, though a byte
-                    # range **is** inclusive of both endpoints.
-                    end_byte = slice_.stop - 1
-                    end = end_byte
-
-                num_chunks, chunk_size = get_chunk_size(7, end_byte - start + 1)
-                # Create the actual download object.
-                stream = io.BytesIO()
-                download = self._make_one(
-                    media_url, chunk_size, stream, start=start, end=end
-                )
-                # Consume the resource in chunks.
-                num_responses, last_response = consume_chunks(
-                    download, authorized_transport, total_bytes, actual_contents
-                )
+    def _check_slice(self, media_url, transport, actual_contents, slice_):
+        # Manually replace a missing start with 0.
+        start = 0 if slice_.start is None else slice_.start
+
+        # First determine how much content is in the slice and
+        # use it to determine a chunking strategy.
+        total_bytes = len(actual_contents)
+        if slice_.stop is None:
+            end_byte = total_bytes - 1
+            end = None
+        else:
+            # Python slices DO NOT include the last index, though a byte
+            # range **is** inclusive of both endpoints.
+            end_byte = slice_.stop - 1
+            end = end_byte
+
+        num_chunks, chunk_size = get_chunk_size(7, end_byte - start + 1)
+        # Create the actual download object.
+        stream = io.BytesIO()
+        download = self._make_one(media_url, chunk_size, stream, start=start, end=end)
+        # Consume the resource in chunks.
+        num_responses, last_response = consume_chunks(
+            download, transport, total_bytes, actual_contents
+        )
+
+        # Make sure the combined chunks are the whole slice.
+        assert stream.getbuffer() == memoryview(actual_contents)[slice_]
+        # Check that we have the right number of responses.
+        assert num_responses == num_chunks
+        # Make sure the last chunk isn't the same size.
+        assert len(last_response.content) < chunk_size
+        check_tombstoned(download)
 
-                # Make sure the combined chunks are the whole slice.
-                assert stream.getvalue() == actual_contents[slice_]
-                # Check that we have the right number of responses.
-                assert num_responses == num_chunks
-                # Make sure the last chunk isn't the same size.
-                assert len(last_response.content) < chunk_size
-                check_tombstoned(download, authorized_transport)
+    @parametrize_sliced_blobs
+    def test_chunked_download_partial(
+        self, add_files, authorized_transport, info, blob_name, media_url
+    ):
+        actual_contents = self._get_contents(info)
+        # Chunked downloads don't support a negative index.
+        slices = [
+            slice_
+            for slice_ in info["slices"]
+            if slice_.start is None or slice_.start >= 0
+        ]
+
+        # Each slice has its own download and stream, so run them
+        # concurrently; ``list()`` re-raises the first failed check.
+        check_slice = functools.partial(
+            self._check_slice, media_url, authorized_transport, actual_contents
+        )
+        with concurrent.futures.ThreadPoolExecutor(len(slices)) as executor:
+            list(executor.map(check_slice, slices))
 
     def test_chunked_with_extra_headers(self, authorized_transport, secret_file):
         blob_name, data, headers = secret_file
@@ -573,7 +677,7 @@ class TestChunkedDownload(object):
         chunk_size = 12
         assert (num_chunks - 1) * chunk_size < len(data) < num_chunks * chunk_size
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         stream = io.BytesIO()
         download = self._make_one(media_url, chunk_size, stream, headers=headers)
         # Consume the resource in chunks.
@@ -586,7 +690,7 @@ class TestChunkedDownload(object):
         assert num_responses == num_chunks
         # Make sure the last chunk isn't the same size.
         assert len(last_response.content) < chunk_size
-        check_tombstoned(download, authorized_transport)
+        check_tombstoned(download)
         # Attempt to consume the resource **without** the headers.
         stream_wo = io.BytesIO()
         download_wo = resumable_requests.ChunkedDownload(
@@ -609,26 +713,26 @@ class TestRawChunkedDownload(TestChunkedDownload):
     def _get_contents(info):
         return get_raw_contents(info)
 
-    def test_chunked_download_full(self, add_files, authorized_transport):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
-
-            total_bytes = len(actual_contents)
-            num_chunks, chunk_size = get_chunk_size(7, total_bytes)
-            # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            stream = io.BytesIO()
-            download = self._make_one(media_url, chunk_size, stream)
-            # Consume the resource in chunks.
-            num_responses, last_response = consume_chunks(
-                download, authorized_transport, total_bytes, actual_contents
-            )
-            # Make sure the combined chunks are the whole object.
-            assert stream.getvalue() == actual_contents
-            # Check that we have the right number of responses.
-            assert num_responses == num_chunks
-            # Make sure the last chunk isn't the same size.
-            assert total_bytes % chunk_size != 0
-            assert len(last_response.content) < chunk_size
-            check_tombstoned(download, authorized_transport)
+    @parametrize_blobs
+    def test_chunked_download_full(
+        self, add_files, authorized_transport, info, blob_name, media_url
+    ):
+        actual_contents = self._get_contents(info)
+
+        total_bytes = len(actual_contents)
+        num_chunks, chunk_size = get_chunk_size(7, total_bytes)
+        # Create the actual download object.
+        stream = io.BytesIO()
+        download = self._make_one(media_url, chunk_size, stream)
+        # Consume the resource in chunks.
+        num_responses, last_response = consume_chunks(
+            download, authorized_transport, total_bytes, actual_contents
+        )
+        # Make sure the combined chunks are the whole object.
+        assert stream.getvalue() == actual_contents
+        # Check that we have the right number of responses.
+        assert num_responses == num_chunks
+        # Make sure the last chunk isn't the same size.
+        assert total_bytes % chunk_size != 0
+        assert len(last_response.content) < chunk_size
+        check_tombstoned(download)
@@ -18,6 +18,7 @@ import http.client
 import io
 import os
 import urllib.parse
+from typing import Set
 
 import pytest  # type: ignore
 from unittest import mock
@@ -33,6 +34,7 @@ from google.resumable_media import _upload
 CURR_DIR = os.path.dirname(os.path.realpath(__file__))
 DATA_DIR = os.path.join(CURR_DIR, "..", "..", "data")
 ICO_FILE = os.path.realpath(os.path.join(DATA_DIR, "favicon.ico"))
+ICO_BLOB_NAME = os.path.basename(ICO_FILE)
 IMAGE_FILE = os.path.realpath(os.path.join(DATA_DIR, "image1.jpg"))
 ICO_CONTENT_TYPE = "image/x-icon"
 JPEG_CONTENT_TYPE = "image/jpeg"
@@ -43,6 +45,10 @@ BAD_CHUNK_SIZE_MSG = (
     b"to be the exact multiple of 262144).  The received request contained "
     b"1024 bytes, which does not meet this requirement."
 )
+# Three chunks worth of data for the resumable "recover" tests.
+RECOVER_DATA = b"123" * resumable_media.UPLOAD_CHUNK_SIZE
+# Blobs which ``cleanup`` has deleted and no test has claimed since.
+_KNOWN_ABSENT: Set[str] = set()
 
 
 @pytest.fixture
@@ -54,10 +60,26 @@ def cleanup():
 
     yield add_cleanup
 
+    # Delete the blobs with one batch request per transport.
+    by_transport = {}
     for blob_name, transport in to_delete:
-        metadata_url = utils.METADATA_URL_TEMPLATE.format(blob_name=blob_name)
-        response = utils.retry_transient_errors(transport.delete)(metadata_url)
-        assert response.status_code == http.client.NO_CONTENT
+        by_transport.setdefault(transport, []).append(blob_name)
+
+    for transport, blob_names in by_transport.items():
+        status_codes = utils.delete_blobs(transport, blob_names)
+        assert status_codes == [http.client.NO_CONTENT] * len(blob_names)
+        _KNOWN_ABSENT.update(blob_names)
+
+
+@pytest.fixture(scope="module")
+def ico_bytes():
+    with open(ICO_FILE, "rb") as file_obj:
+        return file_obj.read()
+
+
+@pytest.fixture(scope="module")
+def ico_md5(ico_bytes):
+    return get_md5(ico_bytes)
 
 
 @pytest.fixture
@@ -98,14 +120,17 @@ def check_response(
     total_bytes=None,
     metadata=None,
     content_type=ICO_CONTENT_TYPE,
+    expected_md5=None,
 ):
     assert response.status_code == http.client.OK
     json_response = response.json()
     assert json_response["bucket"] == utils.BUCKET_NAME
     assert json_response["contentType"] == content_type
     if actual_contents is not None:
+        if expected_md5 is None:
+            expected_md5 = get_md5(actual_contents)
         md5_hash = json_response["md5Hash"].encode("ascii")
-        assert md5_hash == get_md5(actual_contents)
+        assert md5_hash == expected_md5
         total_bytes = len(actual_contents)
     assert json_response["metageneration"] == "1"
     assert json_response["name"] == blob_name
@@ -118,15 +143,17 @@ def check_response(
 
 
 def check_content(blob_name, expected_content, transport, headers=None):
-    media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+    media_url = utils.get_media_url(blob_name)
     download = resumable_requests.Download(media_url, headers=headers)
     response = download.consume(transport)
     assert response.status_code == http.client.OK
     assert response.content == expected_content
 
 
-def check_tombstoned(upload, transport, *args):
+def check_tombstoned(upload, *args):
     assert upload.finished
+    # A finished upload must refuse to run before touching the transport.
+    transport = mock.Mock(spec=["request"])
     basic_types = (resumable_requests.SimpleUpload, resumable_requests.MultipartUpload)
     if isinstance(upload, basic_types):
         with pytest.raises(ValueError):
@@ -134,10 +161,17 @@ def check_tombstoned(upload, transport, *args):
     else:
         with pytest.raises(ValueError):
             upload.transmit_next_chunk(transport, *args)
+    transport.request.assert_not_called()
 
 
 def check_does_not_exist(transport, blob_name):
-    metadata_url = utils.METADATA_URL_TEMPLATE.format(blob_name=blob_name)
+    # A blob we just saw deleted can't exist; the caller is about to create
+    # it, though, so the next check has to ask the server again.
+    if blob_name in _KNOWN_ABSENT:
+        _KNOWN_ABSENT.remove(blob_name)
+        return
+
+    metadata_url = utils.get_metadata_url(blob_name)
     # Make sure we are creating a **new** object.
     response = transport.get(metadata_url)
     assert response.status_code == http.client.NOT_FOUND
@@ -168,44 +202,50 @@ def check_bad_chunk(upload, transport):
 def transmit_chunks(
     upload, transport, blob_name, metadata, num_chunks=0, content_type=JPEG_CONTENT_TYPE
 ):
+    trace = []
     while not upload.finished:
-        num_chunks += 1
         response = upload.transmit_next_chunk(transport)
-        if upload.finished:
-            assert upload.bytes_uploaded == upload.total_bytes
-            check_response(
-                response,
-                blob_name,
-                total_bytes=upload.total_bytes,
-                metadata=metadata,
-                content_type=content_type,
-            )
-        else:
-            assert upload.bytes_uploaded == num_chunks * upload.chunk_size
-            assert response.status_code == http.client.PERMANENT_REDIRECT
+        trace.append((response.status_code, upload.bytes_uploaded))
+
+    # Every chunk but the last is acknowledged with a 308 and advances
+    # ``bytes_uploaded`` by exactly one chunk.
+    expected_trace = [
+        (http.client.PERMANENT_REDIRECT, (num_chunks + index) * upload.chunk_size)
+        for index in range(1, len(trace))
+    ]
+    assert trace[:-1] == expected_trace
+    assert upload.bytes_uploaded == upload.total_bytes
+    check_response(
+        response,
+        blob_name,
+        total_bytes=upload.total_bytes,
+        metadata=metadata,
+        content_type=content_type,
+    )
 
-    return num_chunks
+    return num_chunks + len(trace)
 
 
-def test_simple_upload(authorized_transport, bucket, cleanup):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_simple_upload(authorized_transport, bucket, cleanup, ico_bytes, ico_md5):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     # Make sure to clean up the uploaded blob when we are done.
     cleanup(blob_name, authorized_transport)
     check_does_not_exist(authorized_transport, blob_name)
 
     # Create the actual upload object.
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     upload = resumable_requests.SimpleUpload(upload_url)
     # Transmit the resource.
     response = upload.transmit(authorized_transport, actual_contents, ICO_CONTENT_TYPE)
-    check_response(response, blob_name, actual_contents=actual_contents)
+    check_response(
+        response, blob_name, actual_contents=actual_contents, expected_md5=ico_md5
+    )
     # Download the content to make sure it's "working as expected".
     check_content(blob_name, actual_contents, authorized_transport)
     # Make sure the upload is tombstoned.
-    check_tombstoned(upload, authorized_transport, actual_contents, ICO_CONTENT_TYPE)
+    check_tombstoned(upload, actual_contents, ICO_CONTENT_TYPE)
 
 
 def test_simple_upload_with_headers(authorized_transport, bucket, cleanup):
@@ -215,7 +255,7 @@ def test_simple_upload_with_headers(authorized_transport, bucket, cleanup):
     check_does_not_exist(authorized_transport, blob_name)
 
     # Create the actual upload object.
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     headers = utils.get_encryption_headers()
     upload = resumable_requests.SimpleUpload(upload_url, headers=headers)
     # Transmit the resource.
@@ -227,15 +267,16 @@ def test_simple_upload_with_headers(authorized_transport, bucket, cleanup):
     # Download the content to make sure it's "working as expected".
     check_content(blob_name, data, authorized_transport, headers=headers)
     # Make sure the upload is tombstoned.
-    check_tombstoned(upload, authorized_transport, data, BYTES_CONTENT_TYPE)
+    check_tombstoned(upload, data, BYTES_CONTENT_TYPE)
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
-def test_multipart_upload(authorized_transport, bucket, cleanup, checksum):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_multipart_upload(
+    authorized_transport, bucket, cleanup, checksum, ico_bytes, ico_md5
+):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     # Make sure to clean up the uploaded blob when we are done.
     cleanup(blob_name, authorized_transport)
     check_does_not_exist(authorized_transport, blob_name)
@@ -253,21 +294,21 @@ def test_multipart_upload(authorized_transport, bucket, cleanup, checksum):
         blob_name,
         actual_contents=actual_contents,
         metadata=metadata["metadata"],
+        expected_md5=ico_md5,
     )
     # Download the content to make sure it's "working as expected".
     check_content(blob_name, actual_contents, authorized_transport)
     # Make sure the upload is tombstoned.
-    check_tombstoned(
-        upload, authorized_transport, actual_contents, metadata, ICO_CONTENT_TYPE
-    )
+    check_tombstoned(upload, actual_contents, metadata, ICO_CONTENT_TYPE)
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
-def test_multipart_upload_with_bad_checksum(authorized_transport, checksum, bucket):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_multipart_upload_with_bad_checksum(
+    authorized_transport, checksum, bucket, ico_bytes
+):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     check_does_not_exist(authorized_transport, blob_name)
 
     # Create the actual upload object.
@@ -294,9 +335,7 @@ def test_multipart_upload_with_bad_checksum(authorized_transport, checksum, buck
     assert fake_prepared_checksum_digest in message
 
     # Make sure the upload is tombstoned.
-    check_tombstoned(
-        upload, authorized_transport, actual_contents, metadata, ICO_CONTENT_TYPE
-    )
+    check_tombstoned(upload, actual_contents, metadata, ICO_CONTENT_TYPE)
 
 
 def test_multipart_upload_with_headers(authorized_transport, bucket, cleanup):
@@ -319,7 +358,7 @@ def test_multipart_upload_with_headers(authorized_transport, bucket, cleanup):
     # Download the content to make sure it's "working as expected".
     check_content(blob_name, data, authorized_transport, headers=headers)
     # Make sure the upload is tombstoned.
-    check_tombstoned(upload, authorized_transport, data, metadata, BYTES_CONTENT_TYPE)
+    check_tombstoned(upload, data, metadata, BYTES_CONTENT_TYPE)
 
 
 def _resumable_upload_helper(
@@ -351,7 +390,7 @@ def _resumable_upload_helper(
     actual_contents = stream.read()
     check_content(blob_name, actual_contents, authorized_transport, headers=headers)
     # Make sure the upload is tombstoned.
-    check_tombstoned(upload, authorized_transport)
+    check_tombstoned(upload)
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
@@ -438,7 +477,6 @@ def _resumable_upload_recover_helper(
 ):
     blob_name = "some-bytes.bin"
     chunk_size = resumable_media.UPLOAD_CHUNK_SIZE
-    data = b"123" * chunk_size  # 3 chunks worth.
     # Make sure to clean up the uploaded blob when we are done.
     cleanup(blob_name, authorized_transport)
     check_does_not_exist(authorized_transport, blob_name)
@@ -448,7 +486,7 @@ def _resumable_upload_recover_helper(
     )
     # Initiate the upload.
     metadata = {"name": blob_name}
-    stream = io.BytesIO(data)
+    stream = io.BytesIO(RECOVER_DATA)
     response = upload.initiate(
         authorized_transport, stream, metadata, BYTES_CONTENT_TYPE
     )
@@ -470,10 +508,9 @@ def _resumable_upload_recover_helper(
     )
     assert num_chunks == 3
     # Download the content to make sure it's "working as expected".
-    actual_contents = stream.getvalue()
-    check_content(blob_name, actual_contents, authorized_transport, headers=headers)
+    check_content(blob_name, RECOVER_DATA, authorized_transport, headers=headers)
     # Make sure the upload is tombstoned.
-    check_tombstoned(upload, authorized_transport)
+    check_tombstoned(upload)
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
@@ -491,16 +528,16 @@ class TestResumableUploadUnknownSize(object):
     def _check_range_sent(response, start, end, total):
         headers_sent = response.request.headers
         if start is None and end is None:
-            expected_content_range = "bytes */{:d}".format(total)
+            expected_content_range = f"bytes */{total:d}"
         else:
             # Allow total to be an int or a string "*"
-            expected_content_range = "bytes {:d}-{:d}/{}".format(start, end, total)
+            expected_content_range = f"bytes {start:d}-{end:d}/{total}"
 
         assert headers_sent["content-range"] == expected_content_range
 
     @staticmethod
     def _check_range_received(response, size):
-        assert response.headers["range"] == "bytes=0-{:d}".format(size - 1)
+        assert response.headers["range"] == f"bytes=0-{size - 1:d}"
 
     def _check_partial(self, upload, response, chunk_size, num_chunks):
         start_byte = (num_chunks - 1) * chunk_size
@@ -516,15 +553,15 @@ class TestResumableUploadUnknownSize(object):
 
     @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
     def test_smaller_than_chunk_size(
-        self, authorized_transport, bucket, cleanup, checksum
+        self, authorized_transport, bucket, cleanup, checksum, ico_bytes
     ):
-        blob_name = os.path.basename(ICO_FILE)
+        blob_name = ICO_BLOB_NAME
         chunk_size = resumable_media.UPLOAD_CHUNK_SIZE
         # Make sure to clean up the uploaded blob when we are done.
         cleanup(blob_name, authorized_transport)
         check_does_not_exist(authorized_transport, blob_name)
         # Make sure the blob is smaller than the chunk size.
-        total_bytes = os.path.getsize(ICO_FILE)
+        total_bytes = len(ico_bytes)
         assert total_bytes < chunk_size
         # Create the actual upload object.
         upload = resumable_requests.ResumableUpload(
@@ -532,7 +569,7 @@ class TestResumableUploadUnknownSize(object):
         )
         # Initiate the upload.
         metadata = {"name": blob_name}
-        with open(ICO_FILE, "rb") as stream:
+        with io.BytesIO(ico_bytes) as stream:
             response = upload.initiate(
                 authorized_transport,
                 stream,
@@ -553,7 +590,7 @@ class TestResumableUploadUnknownSize(object):
             actual_contents = stream.read()
             check_content(blob_name, actual_contents, authorized_transport)
             # Make sure the upload is tombstoned.
-            check_tombstoned(upload, authorized_transport)
+            check_tombstoned(upload)
 
     @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
     def test_finish_at_chunk(self, authorized_transport, bucket, cleanup, checksum):
@@ -654,7 +691,8 @@ class TestResumableUploadUnknownSize(object):
         check_response(
             response2,
             blob_name,
-            actual_contents=stream.getvalue(),
+            # Hash the stream's buffer in place, rather than a copy of it.
+            actual_contents=stream.getbuffer(),
             total_bytes=total_bytes,
             content_type=BYTES_CONTENT_TYPE,
         )
@@ -662,11 +700,10 @@ class TestResumableUploadUnknownSize(object):
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
-def test_XMLMPU(authorized_transport, bucket, cleanup, checksum):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_XMLMPU(authorized_transport, bucket, cleanup, checksum, ico_bytes):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     # Make sure to clean up the uploaded blob when we are done.
     cleanup(blob_name, authorized_transport)
     check_does_not_exist(authorized_transport, blob_name)
@@ -699,11 +736,10 @@ def test_XMLMPU(authorized_transport, bucket, cleanup, checksum):
 
 
 @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
-def test_XMLMPU_with_bad_checksum(authorized_transport, bucket, checksum):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_XMLMPU_with_bad_checksum(authorized_transport, bucket, checksum, ico_bytes):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     # No need to clean up, since the upload will not be finalized successfully.
     check_does_not_exist(authorized_transport, blob_name)
 
@@ -743,11 +779,10 @@ def test_XMLMPU_with_bad_checksum(authorized_transport, bucket, checksum):
         )
 
 
-def test_XMLMPU_cancel(authorized_transport, bucket):
-    with open(ICO_FILE, "rb") as file_obj:
-        actual_contents = file_obj.read()
+def test_XMLMPU_cancel(authorized_transport, bucket, ico_bytes):
+    actual_contents = ico_bytes
 
-    blob_name = os.path.basename(ICO_FILE)
+    blob_name = ICO_BLOB_NAME
     check_does_not_exist(authorized_transport, blob_name)
 
     # Create the actual upload object.
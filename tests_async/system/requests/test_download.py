@@ -14,6 +14,7 @@
 
 import base64
 import copy
+import functools
 import hashlib
 import http.client
 import io
@@ -137,21 +138,25 @@ ALL_FILES = (
 )
 
 
-def get_contents_for_upload(info):
-    with open(info["path"], "rb") as file_obj:
+@functools.lru_cache(maxsize=None)
+def _read_file(path):
+    # The data files never change, so read each of them at most once.
+    with open(path, "rb") as file_obj:
         return file_obj.read()
 
 
+def get_contents_for_upload(info):
+    return _read_file(info["path"])
+
+
 def get_contents(info):
     full_path = info.get("uncompressed", info["path"])
-    with open(full_path, "rb") as file_obj:
-        return file_obj.read()
+    return _read_file(full_path)
 
 
 def get_raw_contents(info):
     full_path = info["path"]
-    with open(full_path, "rb") as file_obj:
-        return file_obj.read()
+    return _read_file(full_path)
 
 
 def get_blob_name(info):
@@ -159,8 +164,15 @@ def get_blob_name(info):
     return os.path.basename(full_path)
 
 
+# Blob name and media URL for each of ``ALL_FILES``, computed just once.
+ALL_BLOBS = tuple(
+    (info, get_blob_name(info), utils.get_media_url(get_blob_name(info)))
+    for info in ALL_FILES
+)
+
+
 async def delete_blob(transport, blob_name):
-    metadata_url = utils.METADATA_URL_TEMPLATE.format(blob_name=blob_name)
+    metadata_url = utils.get_metadata_url(blob_name)
     response = await transport.request("DELETE", metadata_url)
     assert response.status == http.client.NO_CONTENT
 
@@ -170,7 +182,7 @@ async def secret_file(authorized_transport, bucket):
     blob_name = "super-seekrit.txt"
     data = b"Please do not tell anyone my encrypted seekrit."
 
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     headers = utils.get_encryption_headers()
     upload = resumable_requests.SimpleUpload(upload_url, headers=headers)
     response = await upload.transmit(authorized_transport, data, PLAIN_TEXT)
@@ -191,7 +203,7 @@ async def corrupting_transport():
 @pytest.fixture(scope="module")
 async def simple_file(authorized_transport, bucket):
     blob_name = "basic-file.txt"
-    upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
+    upload_url = utils.get_simple_upload_url(blob_name)
     upload = resumable_requests.SimpleUpload(upload_url)
     data = b"Simple contents"
     response = await upload.transmit(authorized_transport, data, PLAIN_TEXT)
@@ -202,35 +214,39 @@ async def simple_file(authorized_transport, bucket):
     await delete_blob(authorized_transport, blob_name)
 
 
+async def upload_file(transport, info):
+    to_upload = get_contents_for_upload(info)
+    blob_name = get_blob_name(info)
+
+    if "metadata" in info:
+        upload = resumable_requests.MultipartUpload(utils.MULTIPART_UPLOAD)
+        metadata = copy.deepcopy(info["metadata"])
+        metadata["name"] = blob_name
+        response = await upload.transmit(
+            transport, to_upload, metadata, info["content_type"]
+        )
+    else:
+        upload_url = utils.get_simple_upload_url(blob_name)
+        upload = resumable_requests.SimpleUpload(upload_url)
+        response = await upload.transmit(transport, to_upload, info["content_type"])
+
+    assert response.status == http.client.OK
+    return blob_name
+
+
 @pytest.fixture(scope="module")
 async def add_files(authorized_transport, bucket):
-    blob_names = []
-    for info in ALL_FILES:
-        to_upload = get_contents_for_upload(info)
-        blob_name = get_blob_name(info)
-
-        blob_names.append(blob_name)
-        if "metadata" in info:
-            upload = resumable_requests.MultipartUpload(utils.MULTIPART_UPLOAD)
-            metadata = copy.deepcopy(info["metadata"])
-            metadata["name"] = blob_name
-            response = await upload.transmit(
-                authorized_transport, to_upload, metadata, info["content_type"]
-            )
-        else:
-            upload_url = utils.SIMPLE_UPLOAD_TEMPLATE.format(blob_name=blob_name)
-            upload = resumable_requests.SimpleUpload(upload_url)
-            response = await upload.transmit(
-                authorized_transport, to_upload, info["content_type"]
-            )
-
-        assert response.status == http.client.OK
+    # The uploads are independent, so overlap them.
+    blob_names = await asyncio.gather(
+        *(upload_file(authorized_transport, info) for info in ALL_FILES)
+    )
 
     yield
 
     # Clean-up the blobs we created.
-    for blob_name in blob_names:
-        await delete_blob(authorized_transport, blob_name)
+    await asyncio.gather(
+        *(delete_blob(authorized_transport, blob_name) for blob_name in blob_names)
+    )
 
 
 async def check_tombstoned(download, transport):
@@ -277,12 +293,10 @@ class TestDownload(object):
     @pytest.mark.asyncio
     @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
     async def test_download_full(self, add_files, authorized_transport, checksum):
-        for info in ALL_FILES:
+        for info, blob_name, media_url in ALL_BLOBS:
             actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
 
             # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
             download = self._make_one(media_url, checksum=checksum)
             # Consume the resource.
             response = await download.consume(authorized_transport)
@@ -296,7 +310,7 @@ class TestDownload(object):
     async def test_extra_headers(self, authorized_transport, secret_file):
         blob_name, data, headers = secret_file
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url, headers=headers)
         # Consume the resource.
         response = await download.consume(authorized_transport)
@@ -318,7 +332,7 @@ class TestDownload(object):
     @pytest.mark.asyncio
     async def test_non_existent_file(self, authorized_transport, bucket):
         blob_name = "does-not-exist.txt"
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url)
 
         # Try to consume the resource and fail.
@@ -335,7 +349,7 @@ class TestDownload(object):
         end = 63
         assert len(data) < start < end
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         download = self._make_one(media_url, start=start, end=end)
 
         # Try to consume the resource and fail.
@@ -360,14 +374,18 @@ class TestDownload(object):
 
     @pytest.mark.asyncio
     async def test_download_partial(self, add_files, authorized_transport):
-        for info in ALL_FILES:
-            actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
+        for info, blob_name, media_url in ALL_BLOBS:
+            # Slicing a memoryview compares each range without copying it.
+            actual_contents = memoryview(self._get_contents(info))
+
+            slices = info["slices"]
+            downloads = [self._download_slice(media_url, slice_) for slice_ in slices]
+            # The slices are independent, so download them concurrently.
+            responses = await asyncio.gather(
+                *(download.consume(authorized_transport) for download in downloads)
+            )
 
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
-            for slice_ in info["slices"]:
-                download = self._download_slice(media_url, slice_)
-                response = await download.consume(authorized_transport)
+            for slice_, download, response in zip(slices, downloads, responses):
                 assert response.status == http.client.PARTIAL_CONTENT
                 content = await response.content.read()
                 assert content == actual_contents[slice_]
@@ -392,11 +410,8 @@ class TestRawDownload(TestDownload):
     @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
     @pytest.mark.asyncio
     async def test_corrupt_download(self, add_files, corrupting_transport, checksum):
-        for info in ALL_FILES:
-            blob_name = get_blob_name(info)
-
+        for info, blob_name, media_url in ALL_BLOBS:
             # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
             stream = io.BytesIO()
             download = self._make_one(media_url, stream=stream, checksum=checksum)
             # Consume the resource.
@@ -423,11 +438,8 @@ class TestRawDownload(TestDownload):
     async def test_corrupt_download_no_check(
         self, add_files, corrupting_transport, checksum
     ):
-        for info in ALL_FILES:
-            blob_name = get_blob_name(info)
-
+        for info, blob_name, media_url in ALL_BLOBS:
             # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
             stream = io.BytesIO()
             download = self._make_one(media_url, stream=stream, checksum=None)
             # Consume the resource.
@@ -491,11 +503,9 @@ class TestChunkedDownload(object):
 
     @pytest.mark.asyncio
     async def test_chunked_download_partial(self, add_files, authorized_transport):
-        for info in ALL_FILES:
+        for info, blob_name, media_url in ALL_BLOBS:
             actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
 
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
             for slice_ in info["slices"]:
                 # Manually replace a missing start with 0.
                 start = 0 if slice_.start is None else slice_.start
@@ -527,7 +537,7 @@ class TestChunkedDownload(object):
                 )
 
                 # Make sure the combined chunks are the whole slice.
-                assert stream.getvalue() == actual_contents[slice_]
+                assert stream.getbuffer() == memoryview(actual_contents)[slice_]
                 # Check that we have the right number of responses.
                 assert num_responses == num_chunks
                 # Make sure the last chunk isn't the same size.
@@ -542,7 +552,7 @@ class TestChunkedDownload(object):
         chunk_size = 12
         assert (num_chunks - 1) * chunk_size < len(data) < num_chunks * chunk_size
         # Create the actual download object.
-        media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
+        media_url = utils.get_media_url(blob_name)
         stream = io.BytesIO()
         download = self._make_one(media_url, chunk_size, stream, headers=headers)
         # Consume the resource in chunks.
@@ -583,14 +593,12 @@ class TestRawChunkedDownload(TestChunkedDownload):
 
     @pytest.mark.asyncio
     async def test_chunked_download_full(self, add_files, authorized_transport):
-        for info in ALL_FILES:
+        for info, blob_name, media_url in ALL_BLOBS:
             actual_contents = self._get_contents(info)
-            blob_name = get_blob_name(info)
 
             total_bytes = len(actual_contents)
             num_chunks, chunk_size = get_chunk_size(7, total_bytes)
             # Create the actual download object.
-            media_url = utils.DOWNLOAD_URL_TEMPLATE.format(blob_name=blob_name)
             stream = io.BytesIO()
             download = self._make_one(media_url, chunk_size, stream)
             # Consume the resource in chunks.